@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import os
 import re
+import sys
 import glob
 import json
 import math
@@ -16,6 +17,7 @@ import hashlib
 import tarfile
 import zipfile
 import argparse
+import tempfile
 import fractions
 import functools
 import collections
@@ -24,9 +26,17 @@ import pandas as pd
 import multiprocessing as mp
 
 from copy import deepcopy
+from operator import attrgetter, itemgetter
 from argparse import Namespace
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Set, Tuple, Union, Iterable
+from typing import Any, Dict, FrozenSet, List, Set, Tuple, Union, Iterable
+
+try:
+    # PyArrow parses large tab-delimited reference tables much faster and with a smaller memory
+    # footprint than the pandas CSV reader, but is not a required anvi'o dependency.
+    import pyarrow.csv as pyarrow_csv
+except ImportError:
+    pyarrow_csv = None
 
 import anvio.utils as utils
 import anvio.dbinfo as dbinfo
@@ -64,8 +74,27 @@ PangenomicNetworkStats = Dict[str, Dict[str, Any]]
 
 RANDOM_SEED = 1066
 
+# Prebuilt INSERT statements for storing reaction networks. The table structures are constants, so
+# the placeholder strings need not be rebuilt on each store call.
+GENE_FUNCTION_REACTIONS_INSERT_SQL = (
+    f"INSERT INTO {tables.gene_function_reactions_table_name} VALUES "
+    f"({','.join('?' * len(tables.gene_function_reactions_table_structure))})"
+)
+GENE_FUNCTION_METABOLITES_INSERT_SQL = (
+    f"INSERT INTO {tables.gene_function_metabolites_table_name} VALUES "
+    f"({','.join('?' * len(tables.gene_function_metabolites_table_structure))})"
+)
+PAN_GENE_CLUSTER_FUNCTION_REACTIONS_INSERT_SQL = (
+    f"INSERT INTO {tables.pan_gene_cluster_function_reactions_table_name} VALUES "
+    f"({','.join('?' * len(tables.pan_gene_cluster_function_reactions_table_structure))})"
+)
+PAN_GENE_CLUSTER_FUNCTION_METABOLITES_INSERT_SQL = (
+    f"INSERT INTO {tables.pan_gene_cluster_function_metabolites_table_name} VALUES "
+    f"({','.join('?' * len(tables.pan_gene_cluster_function_metabolites_table_structure))})"
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class ModelSEEDCompound:
     """
     Representation of a chemical (a compound, element, or ions thereof) or a class of chemicals
@@ -105,7 +134,7 @@ class ModelSEEDCompound:
     formula: str = None
     abundances: Dict[str, float] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class ModelSEEDReaction:
     """
     Representation of a reaction, with properties given by the ModelSEED Biochemistry database.
@@ -120,14 +149,15 @@ class ModelSEEDReaction:
         Name of the reaction, e.g., 'rxn00001' has the name, 'diphosphate phosphohydrolase'. When
         absent in the database, assumes a value of None.
 
-    kegg_aliases : Tuple[str], None
+    kegg_aliases : FrozenSet[str], None
         The KEGG REACTION IDs that are known to possibly alias the ModelSEED reaction, according to
-        the ModelSEED database, e.g., 'rxn00001' has the aliases, ('R00004'). A KEGG REACTION ID is
-        formatted 'RXXXXX', where each X is a digit, e.g., 'R00001'.
+        the ModelSEED database, e.g., 'rxn00001' has the alias, 'R00004'. A KEGG REACTION ID is
+        formatted 'RXXXXX', where each X is a digit, e.g., 'R00001'. Aliases are kept in a
+        frozenset for constant-time membership checks and set operations.
 
-    ec_number_aliases : Tuple[str], None
+    ec_number_aliases : FrozenSet[str], None
         The EC numbers that are known to possibly alias the ModelSEED reaction, according to the
-        ModelSEED database, e.g., 'rxn00001' has the aliases, ('3.6.1.1').
+        ModelSEED database, e.g., 'rxn00001' has the alias, '3.6.1.1'.
 
     compounds : Tuple[ModelSEEDCompound], None
         ModelSEED compound IDs of reactants and products involved in the reaction, e.g., 'rxn00001'
@@ -157,14 +187,14 @@ class ModelSEEDReaction:
     """
     modelseed_id: str = None
     modelseed_name: str = None
-    kegg_aliases: Tuple[str] = None
-    ec_number_aliases: Tuple[str] = None
+    kegg_aliases: FrozenSet[str] = None
+    ec_number_aliases: FrozenSet[str] = None
     compounds: Tuple[ModelSEEDCompound] = None
     coefficients: Tuple[int] = None
     compartments: Tuple[str] = None
     reversibility: bool = None
 
-@dataclass
+@dataclass(slots=True)
 class KO:
     """
     Representation of a KEGG Ortholog (KO).
@@ -207,7 +237,7 @@ class KO:
     kegg_reaction_aliases: Dict[str, List[str]] = field(default_factory=dict)
     ec_number_aliases: Dict[str, List[str]] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class Gene:
     """
     Representation of a gene.
@@ -234,7 +264,7 @@ class Gene:
     e_values: Dict[str, float] = field(default_factory=dict)
     protein: Protein = None
 
-@dataclass
+@dataclass(slots=True)
 class Protein:
     """
     This object stores protein abundance data (from proteomics, for instance).
@@ -255,7 +285,7 @@ class Protein:
     genes: Dict[int, Gene] = field(default_factory=dict)
     abundances: Dict[str, float] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class GeneCluster:
     """
     Representation of a gene cluster.
@@ -787,12 +817,14 @@ class ReactionNetwork:
         stats['Reactions and KO sources'] = stats_group = {}
 
         stats_group['Reactions in network'] = len(self.reactions)
-        reaction_counts = []
-        for ko in self.kos.values():
-            reaction_counts.append(len(ko.reactions))
-        stats_group['Mean reactions per KO'] = round(np.mean(reaction_counts), 1)
-        stats_group['Stdev reactions per KO'] = round(np.std(reaction_counts), 1)
-        stats_group['Max reactions per KO'] = max(reaction_counts)
+        # Collect counts directly into a NumPy array so the reductions run in one pass each over a
+        # contiguous array rather than over a Python list of boxed integers.
+        reaction_counts = np.fromiter(
+            (len(ko.reactions) for ko in self.kos.values()), dtype=np.int64, count=len(self.kos)
+        )
+        stats_group['Mean reactions per KO'] = round(reaction_counts.mean(), 1)
+        stats_group['Stdev reactions per KO'] = round(reaction_counts.std(), 1)
+        stats_group['Max reactions per KO'] = int(reaction_counts.max())
 
         self.progress.end()
 
@@ -826,20 +858,24 @@ class ReactionNetwork:
         )
 
         stats_group['KEGG reactions contributing to network'] = len(self.kegg_modelseed_aliases)
-        reaction_counts = []
-        for modelseed_reaction_ids in self.kegg_modelseed_aliases.values():
-            reaction_counts.append(len(modelseed_reaction_ids))
-        stats_group['Mean reactions per KEGG reaction'] = round(np.mean(reaction_counts), 1)
-        stats_group['Stdev reactions per KEGG reaction'] = round(np.std(reaction_counts), 1)
-        stats_group['Max reactions per KEGG reaction'] = max(reaction_counts)
+        reaction_counts = np.fromiter(
+            (len(modelseed_reaction_ids) for modelseed_reaction_ids in self.kegg_modelseed_aliases.values()),
+            dtype=np.int64,
+            count=len(self.kegg_modelseed_aliases)
+        )
+        stats_group['Mean reactions per KEGG reaction'] = round(reaction_counts.mean(), 1)
+        stats_group['Stdev reactions per KEGG reaction'] = round(reaction_counts.std(), 1)
+        stats_group['Max reactions per KEGG reaction'] = int(reaction_counts.max())
 
         stats_group['EC numbers contributing to network'] = len(self.ec_number_modelseed_aliases)
-        reaction_counts = []
-        for modelseed_reaction_ids in self.ec_number_modelseed_aliases.values():
-            reaction_counts.append(len(modelseed_reaction_ids))
-        stats_group['Mean reactions per EC number'] = round(np.mean(reaction_counts), 1)
-        stats_group['Stdev reactions per EC number'] = round(np.std(reaction_counts), 1)
-        stats_group['Max reactions per EC number'] = max(reaction_counts)
+        reaction_counts = np.fromiter(
+            (len(modelseed_reaction_ids) for modelseed_reaction_ids in self.ec_number_modelseed_aliases.values()),
+            dtype=np.int64,
+            count=len(self.ec_number_modelseed_aliases)
+        )
+        stats_group['Mean reactions per EC number'] = round(reaction_counts.mean(), 1)
+        stats_group['Stdev reactions per EC number'] = round(reaction_counts.std(), 1)
+        stats_group['Max reactions per EC number'] = int(reaction_counts.max())
 
         self.progress.end()
 
@@ -849,41 +885,39 @@ class ReactionNetwork:
 
         reversible_count = 0
         irreversible_count = 0
-        cytoplasmic_compound_ids = []
-        extracellular_compound_ids = []
-        consumed_compound_ids = []
-        produced_compound_ids = []
-        compound_reaction_counts = {}
+        # Accumulate compound IDs directly into sets: a compound recurs across many reactions,
+        # and intermediate lists would grow with every occurrence before deduplication.
+        cytoplasmic_compound_ids = set()
+        extracellular_compound_ids = set()
+        consumed_compound_ids = set()
+        produced_compound_ids = set()
+        compound_reaction_counts = collections.defaultdict(int)
         for reaction in self.reactions.values():
             if reaction.reversibility:
                 reversible_count += 1
             else:
                 irreversible_count += 1
-            encountered_compound_ids = []
+            encountered_compound_ids = set()
             for compartment, coefficient, compound in zip(
                 reaction.compartments, reaction.coefficients, reaction.compounds
             ):
                 compound_id = compound.modelseed_id
                 if compartment == 'c':
-                    cytoplasmic_compound_ids.append(compound_id)
+                    cytoplasmic_compound_ids.add(compound_id)
                 else:
-                    extracellular_compound_ids.append(compound_id)
+                    extracellular_compound_ids.add(compound_id)
                 if reaction.reversibility:
-                    consumed_compound_ids.append(compound_id)
-                    produced_compound_ids.append(compound_id)
+                    consumed_compound_ids.add(compound_id)
+                    produced_compound_ids.add(compound_id)
                 elif coefficient < 0:
-                    consumed_compound_ids.append(compound_id)
+                    consumed_compound_ids.add(compound_id)
                 else:
-                    produced_compound_ids.append(compound_id)
+                    produced_compound_ids.add(compound_id)
                 if compound_id not in encountered_compound_ids:
-                    try:
-                        compound_reaction_counts[compound_id] += 1
-                    except KeyError:
-                        compound_reaction_counts[compound_id] = 1
+                    encountered_compound_ids.add(compound_id)
+                    compound_reaction_counts[compound_id] += 1
         stats_group['Reversible reactions'] = reversible_count
         stats_group['Irreversible reactions'] = irreversible_count
-        cytoplasmic_compound_ids = set(cytoplasmic_compound_ids)
-        extracellular_compound_ids = set(extracellular_compound_ids)
         stats_group['Metabolites in network'] = metabolite_count = len(self.metabolites)
         stats_group['Cytoplasmic metabolites'] = len(cytoplasmic_compound_ids)
         stats_group['Extracellular metabolites'] = len(extracellular_compound_ids)
@@ -896,8 +930,6 @@ class ReactionNetwork:
         stats_group['Cytoplasmic/extracellular metabolites'] = len(
             cytoplasmic_compound_ids.intersection(extracellular_compound_ids)
         )
-        consumed_compound_ids = set(consumed_compound_ids)
-        produced_compound_ids = set(produced_compound_ids)
         stats_group['Consumed metabolites'] = len(consumed_compound_ids)
         stats_group['Produced metabolites'] = len(produced_compound_ids)
         stats_group['Both consumed & produced metabolites'] = len(
@@ -4556,7 +4588,25 @@ class KODatabase:
         self.release = ' '.join(f.readline().strip().split()[1:])
         f.close()
 
-        self.ko_table = pd.read_csv(os.path.join(ko_dir, 'ko_data.tsv'), sep='\t', header=0, index_col=0, low_memory=False)
+        self.ko_table = read_tabular_data_file(os.path.join(ko_dir, 'ko_data.tsv'))
+        # Intern the KO IDs, which serve as dictionary keys throughout network construction, so
+        # that each unique ID is stored once and repeated hash lookups compare by identity.
+        self.ko_table.index = self.ko_table.index.map(sys.intern)
+        # Materialize table rows once as namedtuples keyed by KO ID. Label-based DataFrame lookup
+        # constructs a Series per row, which is far more costly than a dictionary hit in the per-KO
+        # loops of network construction.
+        self.ko_rows: Dict[str, tuple] = {ko_row.Index: ko_row for ko_row in self.ko_table.itertuples()}
+        # Pre-split the space-delimited KEGG REACTION ID and EC number annotations of each KO into
+        # tuples, so each KO is split once at load rather than every time it is newly encountered
+        # in network construction.
+        self.ko_aliases: Dict[str, Tuple[Tuple[str], Tuple[str]]] = {}
+        for ko_row in self.ko_table.itertuples():
+            kegg_reaction_entry = ko_row.reactions
+            ec_number_entry = ko_row.ec_numbers
+            self.ko_aliases[ko_row.Index] = (
+                tuple() if is_na(kegg_reaction_entry) else tuple(map(sys.intern, kegg_reaction_entry.split())),
+                tuple() if is_na(ec_number_entry) else tuple(map(sys.intern, ec_number_entry.split()))
+            )
 
     def set_up(
         num_threads: int = 1,
@@ -4817,44 +4867,78 @@ class ModelSEEDDatabase:
 
         with open(sha_path) as f:
             self.sha = f.read().strip()
-        reactions_table = pd.read_csv(reactions_path, sep='\t', header=0, low_memory=False)
-        self.compounds_table: pd.DataFrame = pd.read_csv(compounds_path, sep='\t', header=0, index_col='id', low_memory=False)
-
-        # Facilitate lookup of reaction data by KEGG REACTION ID via a reorganized reactions table.
-        # Remove reactions without KEGG aliases.
-        reactions_table_without_na = reactions_table.dropna(subset=['KEGG'])
-        expanded = []
-        ko_id_col = []
-        for ko_ids, row in zip(
-            reactions_table_without_na['KEGG'],
-            reactions_table_without_na.itertuples(index=False)
-        ):
-            ko_ids: str
-            # A ModelSEED reaction can have multiple KEGG aliases.
-            for ko_id in ko_ids.split('; '):
-                ko_id_col.append(ko_id)
-                expanded.append(row)
-        kegg_reactions_table = pd.DataFrame(expanded)
-        kegg_reactions_table['KEGG_REACTION_ID'] = ko_id_col
-        self.kegg_reactions_table = kegg_reactions_table
-
-        # Facilitate lookup of reaction data by EC number via a reorganized reactions table.
-        # Remove reactions without EC number aliases.
-        reactions_table_without_na = reactions_table.dropna(subset=['ec_numbers'])
-        expanded = []
-        ec_number_col = []
-        for ec_numbers, row in zip(
-            reactions_table_without_na['ec_numbers'],
-            reactions_table_without_na.itertuples(index=False)
-        ):
-            ec_numbers: str
-            # A ModelSEED reaction can have multiple EC number aliases.
-            for ec_number in ec_numbers.split('|'):
-                ec_number_col.append(ec_number)
-                expanded.append(row)
-        ec_reactions_table = pd.DataFrame(expanded)
-        ec_reactions_table['EC_number'] = ec_number_col
-        self.ec_reactions_table = ec_reactions_table
+        # Restrict loading to the columns consumed in network construction, shrinking the parsed
+        # tables and the rows materialized from them.
+        reactions_table = read_tabular_data_file(
+            reactions_path,
+            usecols=['id', 'name', 'stoichiometry', 'reversibility', 'direction', 'KEGG', 'ec_numbers']
+        )
+        self.compounds_table: pd.DataFrame = read_tabular_data_file(
+            compounds_path, index_col='id', usecols=['id', 'name', 'formula', 'charge', 'KEGG']
+        )
+
+        # Intern the ID strings used pervasively as dictionary keys during network construction.
+        # Interning stores one copy of each unique ID and allows hash lookups to short-circuit on
+        # pointer identity rather than comparing string contents.
+        reactions_table['id'] = reactions_table['id'].map(sys.intern)
+        self.compounds_table.index = self.compounds_table.index.map(sys.intern)
+
+        # A handful of symbols, e.g., '>', '<', '=', cover the reversibility and direction of every
+        # reaction, so store these columns as categoricals: a small integer code per row
+        # referencing shared strings, rather than a separate string object per row. Rows
+        # materialized from the table reference the same few shared strings.
+        reactions_table['reversibility'] = reactions_table['reversibility'].astype('category')
+        reactions_table['direction'] = reactions_table['direction'].astype('category')
+
+        self.reactions_table = reactions_table
+
+        # Facilitate lookup of reaction data by KEGG REACTION ID or EC number. A ModelSEED reaction
+        # can have multiple aliases of each type, so map each alias to the integer positions of the
+        # aliased rows in the reactions table. Hash-map lookup of the handful of aliases sourced
+        # from a KO replaces a scan of the full table, and the index dictionaries occupy a small
+        # fraction of the memory of tables expanded to one row per alias.
+        self.kegg_reaction_lookup: Dict[str, List[int]] = {}
+        kegg_reaction_lookup = self.kegg_reaction_lookup
+        for row_index, kegg_reaction_ids in reactions_table['KEGG'].dropna().str.split('; ').items():
+            for kegg_reaction_id in kegg_reaction_ids:
+                kegg_reaction_id = sys.intern(kegg_reaction_id)
+                try:
+                    kegg_reaction_lookup[kegg_reaction_id].append(row_index)
+                except KeyError:
+                    kegg_reaction_lookup[kegg_reaction_id] = [row_index]
+
+        self.ec_number_lookup: Dict[str, List[int]] = {}
+        ec_number_lookup = self.ec_number_lookup
+        for row_index, ec_numbers in reactions_table['ec_numbers'].dropna().str.split('|').items():
+            for ec_number in ec_numbers:
+                ec_number = sys.intern(ec_number)
+                try:
+                    ec_number_lookup[ec_number].append(row_index)
+                except KeyError:
+                    ec_number_lookup[ec_number] = [row_index]
+
+        # Split every reaction's stoichiometry string in advance with vectorized string operations,
+        # mapping each reaction ID to a list of split entries, each a list of the fields of a
+        # reactant or product: the decimal coefficient, compound ID, and compartment index, among
+        # others. Reactions without a stoichiometry are absent from the dictionary. Parsing here
+        # removes per-entry Python string operations from reaction object construction.
+        split_entries = reactions_table['stoichiometry'].dropna().str.split(';').explode().str.split(':', n=3)
+        reaction_ids = reactions_table['id'].to_numpy()
+        # Materialize table rows once as namedtuples. Attribute access on a namedtuple is faster
+        # than dictionary lookup, and fetching a prebuilt row avoids constructing a Series and then
+        # a dictionary for each row requested during network construction.
+        self.reaction_rows: List[tuple] = list(reactions_table.itertuples(index=False))
+        self.compound_rows: Dict[str, tuple] = {
+            compound_row.Index: compound_row for compound_row in self.compounds_table.itertuples()
+        }
+        self.stoichiometries: Dict[str, List[List[str]]] = {}
+        stoichiometries = self.stoichiometries
+        for row_index, split_entry in zip(split_entries.index.to_numpy(), split_entries.to_numpy()):
+            reaction_id = reaction_ids[row_index]
+            try:
+                stoichiometries[reaction_id].append(split_entry)
+            except KeyError:
+                stoichiometries[reaction_id] = [split_entry]
 
     def set_up(
         dir: str = None,
@@ -4959,7 +5043,7 @@ class ModelSEEDDatabase:
             for aliases in table.aliases:
                 aliases: str
                 new_row = {}
-                if pd.isna(aliases):
+                if is_na(aliases):
                     new_rows.append(new_row)
                     continue
                 split_aliases = aliases.split('|')
@@ -5017,6 +5101,24 @@ class Constructor:
         self.modelseed_dir = modelseed_dir
         self.run = run
         self.progress = progress
+        # The reference databases are not read from their directories until first accessed, and
+        # then the loaded databases are cached for reuse across method calls.
+        self._ko_db: KODatabase = None
+        self._modelseed_db: ModelSEEDDatabase = None
+
+    @property
+    def ko_db(self) -> KODatabase:
+        """The KEGG KO database, loaded from 'ko_dir' on first access."""
+        if self._ko_db is None:
+            self._ko_db = KODatabase(self.ko_dir)
+        return self._ko_db
+
+    @property
+    def modelseed_db(self) -> ModelSEEDDatabase:
+        """The ModelSEED Biochemistry database, loaded from 'modelseed_dir' on first access."""
+        if self._modelseed_db is None:
+            self._modelseed_db = ModelSEEDDatabase(self.modelseed_dir)
+        return self._modelseed_db
 
     def load_network(
         self,
@@ -5675,7 +5777,7 @@ class Constructor:
         # The KO database is needed if KOs in the stored network aren't among the current gene
         # annotations.
         try:
-            ko_db = KODatabase(ko_dir=self.ko_dir)
+            ko_db = self.ko_db
         except ConfigError as e:
             raise ConfigError(
                 f"{e} Please set up the KO database in the default directory with the program, "
@@ -5728,7 +5830,7 @@ class Constructor:
             reaction.kegg_aliases = list(kegg_reaction_ko_ids)
             if other_kegg_reaction_ids:
                 reaction.kegg_aliases += other_kegg_reaction_ids.split(', ')
-            reaction.kegg_aliases = tuple(reaction.kegg_aliases)
+            reaction.kegg_aliases = frozenset(reaction.kegg_aliases)
 
             network.modelseed_kegg_aliases[modelseed_reaction_id] = modelseed_kegg_aliases = []
             orphan_ko_ids = []
@@ -5757,9 +5859,9 @@ class Constructor:
                         # annotations is derived from the pan and genomes storage databases using
                         # the parameters, 'consensus_threshold' and 'discard_ties'.)
                         ko = KO()
-                        ko.ko_id = ko_id
+                        ko.id = ko_id
                         # The KO name is unknown from the database, so take it from the KO database.
-                        ko.ko_name = ko_db.ko_table.loc[ko_id, 'name']
+                        ko.name = ko_db.ko_rows[ko_id].name
                         network.kos[ko_id] = ko
                         orphan_ko_ids.append(ko_id)
                     if not reaction_added_to_ko:
@@ -5788,7 +5890,7 @@ class Constructor:
             reaction.ec_number_aliases = list(ec_number_ko_ids)
             if other_ec_numbers:
                 reaction.ec_number_aliases += other_ec_numbers.split(', ')
-            reaction.ec_number_aliases = tuple(reaction.ec_number_aliases)
+            reaction.ec_number_aliases = frozenset(reaction.ec_number_aliases)
 
             network.modelseed_ec_number_aliases[modelseed_reaction_id] = modelseed_ec_number_aliases = []
             for ec_number, ko_ids in ec_number_ko_ids.items():
@@ -5805,9 +5907,9 @@ class Constructor:
                     except KeyError:
                         # This error arises for the same reason as before (processing KEGG reactions).
                         ko = KO()
-                        ko.ko_id = ko_id
+                        ko.id = ko_id
                         # The KO name is unknown from the database, so take it from the KO database.
-                        ko.ko_name = ko_db.ko_table.loc[ko_id, 'name']
+                        ko.name = ko_db.ko_rows[ko_id].name
                         network.kos[ko_id] = ko
                         orphan_ko_ids.append(ko_id)
                     if not reaction_added_to_ko:
@@ -6068,15 +6170,13 @@ class Constructor:
         self.progress.new("Building reaction network")
         self.progress.update("Loading reference databases")
 
-        ko_db = KODatabase(self.ko_dir)
-        modelseed_db = ModelSEEDDatabase(self.modelseed_dir)
+        ko_db = self.ko_db
+        modelseed_db = self.modelseed_db
 
         network = GenomicNetwork(run=self.run, progress=self.progress)
         network.contigs_db_source_path = os.path.abspath(contigs_db)
 
-        modelseed_kegg_reactions_table = modelseed_db.kegg_reactions_table
-        modelseed_ec_reactions_table = modelseed_db.ec_reactions_table
-        modelseed_compounds_table = modelseed_db.compounds_table
+        modelseed_compound_rows = modelseed_db.compound_rows
 
         # List KOs that annotated genes in the contigs database but for some reason are not found in
         # the KO database.
@@ -6085,12 +6185,13 @@ class Constructor:
         # Parse gene-KO matches recorded in the contigs database.
         gene_function_calls_dict: Dict = contigs_super.gene_function_calls_dict
         total_ko_matches = len(gene_function_calls_dict)
-        num_ko_matches_parsed = -1
-        for gcid, gene_dict in gene_function_calls_dict.items():
-            num_ko_matches_parsed += 1
-            self.progress.update(
-                f"Gene-KO matches parsed: {num_ko_matches_parsed} / {total_ko_matches}"
-            )
+        for num_ko_matches_parsed, (gcid, gene_dict) in enumerate(gene_function_calls_dict.items()):
+            if num_ko_matches_parsed % 1000 == 0 or num_ko_matches_parsed + 1 == total_ko_matches:
+                # Formatting a new message every iteration costs more than the rest of the loop body
+                # for most gene-KO matches, so only refresh the displayed count periodically.
+                self.progress.update(
+                    f"Gene-KO matches parsed: {num_ko_matches_parsed} / {total_ko_matches}"
+                )
 
             if gcid in network.genes:
                 # An object representing the gene was already added to the network.
@@ -6121,22 +6222,10 @@ class Constructor:
 
             # Find KEGG reactions and EC numbers associated with the newly encountered KO.
             try:
-                ko_info = ko_db.ko_table.loc[ko.id]
+                ko_kegg_reaction_ids, ko_ec_numbers = ko_db.ko_aliases[ko.id]
             except KeyError:
                 undefined_ko_ids.append(ko_id)
                 continue
-            ko_kegg_reaction_info: str = ko_info.loc['reactions']
-            if pd.isna(ko_kegg_reaction_info):
-                # The KO is not associated with KEGG reactions.
-                ko_kegg_reaction_ids = []
-            else:
-                ko_kegg_reaction_ids = ko_kegg_reaction_info.split()
-            ko_ec_number_info: str = ko_info.loc['ec_numbers']
-            if pd.isna(ko_ec_number_info):
-                # The KO is not associated with EC numbers.
-                ko_ec_numbers = []
-            else:
-                ko_ec_numbers = ko_ec_number_info.split()
 
             if not (ko_kegg_reaction_ids or ko_ec_numbers):
                 # The KO is not associated with any KEGG reactions or EC numbers, and thereby cannot
@@ -6158,8 +6247,7 @@ class Constructor:
                 network,
                 new_kegg_reaction_ids,
                 new_ec_numbers,
-                modelseed_kegg_reactions_table,
-                modelseed_ec_reactions_table
+                modelseed_db
             )
             if not modelseed_reactions_data:
                 # The newly encountered KEGG REACTION IDs and EC numbers do not map to ModelSEED
@@ -6176,7 +6264,7 @@ class Constructor:
                 # Make a new reaction object for the ModelSEED ID. This object does not yet have
                 # metabolite objects (for the ModelSEED compound IDs) added to it yet.
                 reaction, modelseed_compound_ids = self._get_modelseed_reaction(
-                    modelseed_reaction_data
+                    modelseed_reaction_data, stoichiometries=modelseed_db.stoichiometries
                 )
                 if reaction is None:
                     # For some reason, the reaction does not have a equation in the ModelSEED
@@ -6192,7 +6280,7 @@ class Constructor:
                     new_kegg_reaction_ids,
                     new_ec_numbers,
                     modelseed_compound_ids,
-                    modelseed_compounds_table
+                    modelseed_compound_rows
                 )
 
         # List genes that do not contribute to the reaction network. Remove any trace of these genes
@@ -6289,20 +6377,12 @@ class Constructor:
             self.progress.update("Reactions table")
             reactions_table = self._get_database_reactions_table(network)
             cdb = ContigsDatabase(contigs_db)
-            sql_statement = (
-                f"INSERT INTO {tables.gene_function_reactions_table_name} VALUES "
-                f"({','.join('?' * len(tables.gene_function_reactions_table_structure))})"
-            )
-            cdb.db._exec_many(sql_statement, reactions_table.values)
+            cdb.db._exec_many(GENE_FUNCTION_REACTIONS_INSERT_SQL, reactions_table)
             cdb.disconnect()
             self.progress.update("Metabolites table")
             metabolites_table = self._get_database_metabolites_table(network)
             cdb = ContigsDatabase(contigs_db)
-            sql_statement = (
-                f"INSERT INTO {tables.gene_function_metabolites_table_name} VALUES "
-                f"({','.join('?' * len(tables.gene_function_metabolites_table_structure))})"
-            )
-            cdb.db._exec_many(sql_statement, metabolites_table.values)
+            cdb.db._exec_many(GENE_FUNCTION_METABOLITES_INSERT_SQL, metabolites_table)
             cdb.disconnect()
 
             self.progress.update("Metadata")
@@ -6420,8 +6500,8 @@ class Constructor:
         self.progress.update("Loading reference databases")
 
         # Load the required orthology reference databases set up by anvi'o.
-        ko_db = KODatabase(self.ko_dir)
-        modelseed_db = ModelSEEDDatabase(self.modelseed_dir)
+        ko_db = self.ko_db
+        modelseed_db = self.modelseed_db
 
         network = PangenomicNetwork(run=self.run, progress=self.progress)
         network.pan_db_source_path = os.path.abspath(pan_db)
@@ -6430,9 +6510,7 @@ class Constructor:
         network.discard_ties = discard_ties
         network.consistent_annotations = True
 
-        modelseed_kegg_reactions_table = modelseed_db.kegg_reactions_table
-        modelseed_ec_reactions_table = modelseed_db.ec_reactions_table
-        modelseed_compounds_table = modelseed_db.compounds_table
+        modelseed_compound_rows = modelseed_db.compound_rows
 
         # List KOs that annotated gene clusters in the pan database but for some reason are not
         # found in the KO database.
@@ -6441,12 +6519,15 @@ class Constructor:
         # Parse gene clusters.
         gene_clusters_functions_summary_dict: Dict = pan_super.gene_clusters_functions_summary_dict
         total_gene_clusters = len(pan_super.gene_clusters)
-        num_gene_clusters_parsed = -1
-        for cluster_id, gene_cluster_functions_data in gene_clusters_functions_summary_dict.items():
-            num_gene_clusters_parsed += 1
-            self.progress.update(
-                f"Gene clusters parsed: {num_gene_clusters_parsed} / {total_gene_clusters}"
-            )
+        for num_gene_clusters_parsed, (cluster_id, gene_cluster_functions_data) in enumerate(
+            gene_clusters_functions_summary_dict.items()
+        ):
+            if num_gene_clusters_parsed % 1000 == 0 or num_gene_clusters_parsed + 1 == total_gene_clusters:
+                # Formatting a new message every iteration costs more than the rest of the loop body
+                # for most gene clusters, so only refresh the displayed count periodically.
+                self.progress.update(
+                    f"Gene clusters parsed: {num_gene_clusters_parsed} / {total_gene_clusters}"
+                )
             # Retrieve the consensus KO across genes in the cluster. Parameterization of the method
             # used to select consensus KOs occurred in pan super initialization.
             gene_cluster_ko_data = gene_cluster_functions_data['KOfam']
@@ -6478,22 +6559,10 @@ class Constructor:
 
             # Find KEGG reactions and EC numbers associated with the newly encountered KO.
             try:
-                ko_info = ko_db.ko_table.loc[ko.id]
+                ko_kegg_reaction_ids, ko_ec_numbers = ko_db.ko_aliases[ko.id]
             except KeyError:
                 undefined_ko_ids.append(ko_id)
                 continue
-            ko_kegg_reaction_info: str = ko_info.loc['reactions']
-            if pd.isna(ko_kegg_reaction_info):
-                # The KO is not associated with KEGG reactions.
-                ko_kegg_reaction_ids = []
-            else:
-                ko_kegg_reaction_ids = ko_kegg_reaction_info.split()
-            ko_ec_number_info: str = ko_info.loc['ec_numbers']
-            if pd.isna(ko_ec_number_info):
-                # The KO is not associated with EC numbers.
-                ko_ec_numbers = []
-            else:
-                ko_ec_numbers = ko_ec_number_info.split()
 
             if not (ko_kegg_reaction_ids or ko_ec_numbers):
                 # The KO is not associated with any KEGG reactions or EC numbers, and thereby cannot
@@ -6515,8 +6584,7 @@ class Constructor:
                 network,
                 new_kegg_reaction_ids,
                 new_ec_numbers,
-                modelseed_kegg_reactions_table,
-                modelseed_ec_reactions_table
+                modelseed_db
             )
             if not modelseed_reactions_data:
                 # The newly encountered KEGG REACTION IDs and EC numbers do not map to ModelSEED
@@ -6533,7 +6601,7 @@ class Constructor:
                 # Make a new reaction object for the ModelSEED ID. This object does not yet have
                 # metabolite objects (for the ModelSEED compound IDs) added to it yet.
                 reaction, modelseed_compound_ids = self._get_modelseed_reaction(
-                    modelseed_reaction_data
+                    modelseed_reaction_data, stoichiometries=modelseed_db.stoichiometries
                 )
                 if reaction is None:
                     # For some reason, the reaction does not have a equation in the ModelSEED
@@ -6549,7 +6617,7 @@ class Constructor:
                     new_kegg_reaction_ids,
                     new_ec_numbers,
                     modelseed_compound_ids,
-                    modelseed_compounds_table
+                    modelseed_compound_rows
                 )
 
         # List gene clusters and KOs that do not contribute to the reaction network. Remove any
@@ -6645,22 +6713,12 @@ class Constructor:
             self.progress.update("Reactions table")
             reactions_table = self._get_database_reactions_table(network)
             pdb = PanDatabase(pan_db)
-            table_name = tables.pan_gene_cluster_function_reactions_table_name
-            table_structure = tables.pan_gene_cluster_function_reactions_table_structure
-            pdb.db._exec_many(
-                f'''INSERT INTO {table_name} VALUES ({','.join('?' * len(table_structure))})''',
-                reactions_table.values
-            )
+            pdb.db._exec_many(PAN_GENE_CLUSTER_FUNCTION_REACTIONS_INSERT_SQL, reactions_table)
             pdb.disconnect()
             self.progress.update("Metabolites table")
             metabolites_table = self._get_database_metabolites_table(network)
             pdb = PanDatabase(pan_db)
-            table_name = tables.pan_gene_cluster_function_metabolites_table_name
-            table_structure = tables.gene_function_metabolites_table_structure
-            pdb.db._exec_many(
-                f'''INSERT INTO {table_name} VALUES ({','.join('?' * len(table_structure))})''',
-                metabolites_table.values
-            )
+            pdb.db._exec_many(PAN_GENE_CLUSTER_FUNCTION_METABOLITES_INSERT_SQL, metabolites_table)
             pdb.disconnect()
 
             self.progress.update("Metadata")
@@ -6756,10 +6814,10 @@ class Constructor:
                 ko.reactions[modelseed_reaction_id] = reaction
                 # Record which KEGG REACTION IDs and EC numbers from the KO yield the ModelSEED reaction.
                 ko.kegg_reaction_aliases[modelseed_reaction_id] = list(
-                    set(ko_kegg_reaction_ids).intersection(set(reaction.kegg_aliases))
+                    reaction.kegg_aliases.intersection(ko_kegg_reaction_ids)
                 )
                 ko.ec_number_aliases[modelseed_reaction_id] = list(
-                    set(ko_ec_numbers).intersection(set(reaction.ec_number_aliases))
+                    reaction.ec_number_aliases.intersection(ko_ec_numbers)
                 )
         return new_kegg_reaction_ids
 
@@ -6830,10 +6888,10 @@ class Constructor:
                     continue
                 ko.reactions[modelseed_reaction_id] = reaction
                 ko.kegg_reaction_aliases[modelseed_reaction_id] = list(
-                    set(ko_kegg_reaction_ids).intersection(set(reaction.kegg_aliases))
+                    reaction.kegg_aliases.intersection(ko_kegg_reaction_ids)
                 )
                 ko.ec_number_aliases[modelseed_reaction_id] = list(
-                    set(ko_ec_numbers).intersection(set(reaction.ec_number_aliases))
+                    reaction.ec_number_aliases.intersection(ko_ec_numbers)
                 )
         return new_ec_numbers
 
@@ -6842,8 +6900,7 @@ class Constructor:
         network: ReactionNetwork,
         new_kegg_reaction_ids: List[str],
         new_ec_numbers: List[str],
-        modelseed_kegg_reactions_table: pd.DataFrame,
-        modelseed_ec_reactions_table: pd.DataFrame
+        modelseed_db: ModelSEEDDatabase
     ) -> Dict:
         """
         Get data on ModelSEED reactions aliased by newly encountered KEGG REACTION IDs and EC numbers.
@@ -6859,57 +6916,66 @@ class Constructor:
         new_ec_numbers : List[str]
             Newly encountered EC numbers not associated with previously processed KOs.
 
-        modelseed_kegg_reactions_table : pd.DataFrame
-            Loaded ModelSEED Biochemistry reactions database structured by KEGG REACTION ID.
-
-        modelseed_ec_reactions_table : pd.DataFrame
-            Loaded ModelSEED Biochemistry reactions database structured by EC number.
+        modelseed_db : ModelSEEDDatabase
+            Loaded ModelSEED Biochemistry database with reactions indexed by KEGG REACTION ID and
+            EC number alias.
 
         Returns
         =======
         dict
             Data on the reaction sourced from the ModelSEED Biochemistry database.
         """
+        modelseed_reaction_rows = modelseed_db.reaction_rows
+        # Bind the alias lookup and network alias dictionaries to local names outside the loops,
+        # sparing repeated attribute resolution per alias.
+        kegg_reaction_lookup = modelseed_db.kegg_reaction_lookup
+        ec_number_lookup = modelseed_db.ec_number_lookup
+        kegg_modelseed_aliases = network.kegg_modelseed_aliases
+        ec_number_modelseed_aliases = network.ec_number_modelseed_aliases
+        modelseed_kegg_aliases = network.modelseed_kegg_aliases
+        modelseed_ec_number_aliases = network.modelseed_ec_number_aliases
         modelseed_reactions_data = {}
-        if new_kegg_reaction_ids:
-            # Each row of the table represents a unique KEGG reaction -> ModelSEED reaction mapping.
-            modelseed_kegg_reactions_dict: Dict[str, Dict] = modelseed_kegg_reactions_table[
-                modelseed_kegg_reactions_table['KEGG_REACTION_ID'].isin(new_kegg_reaction_ids)
-            ].to_dict(orient='index')
-            for modelseed_reaction_data in modelseed_kegg_reactions_dict.values():
-                kegg_reaction_id = modelseed_reaction_data['KEGG_REACTION_ID']
-                modelseed_reaction_id = modelseed_reaction_data['id']
+        for kegg_reaction_id in new_kegg_reaction_ids:
+            try:
+                row_indices = kegg_reaction_lookup[kegg_reaction_id]
+            except KeyError:
+                # The KEGG reaction does not alias any ModelSEED reactions.
+                continue
+            for row_index in row_indices:
+                modelseed_reaction_data = modelseed_reaction_rows[row_index]
+                modelseed_reaction_id = modelseed_reaction_data.id
                 # Record the association between the KEGG reaction and ModelSEED reaction in the
                 # network, and vice versa.
-                network.kegg_modelseed_aliases[kegg_reaction_id].append(modelseed_reaction_id)
+                kegg_modelseed_aliases[kegg_reaction_id].append(modelseed_reaction_id)
                 try:
-                    network.modelseed_kegg_aliases[modelseed_reaction_id].append(kegg_reaction_id)
+                    modelseed_kegg_aliases[modelseed_reaction_id].append(kegg_reaction_id)
                 except KeyError:
                     # This is the first time the ModelSEED reaction has been encountered.
-                    network.modelseed_kegg_aliases[modelseed_reaction_id] = [kegg_reaction_id]
-                    network.modelseed_ec_number_aliases[modelseed_reaction_id] = []
+                    modelseed_kegg_aliases[modelseed_reaction_id] = [kegg_reaction_id]
+                    modelseed_ec_number_aliases[modelseed_reaction_id] = []
                 if modelseed_reaction_id in modelseed_reactions_data:
                     # One of the other newly encountered KEGG reactions also mapped to this
                     # ModelSEED reaction, so do not record redundant ModelSEED reaction data.
                     continue
                 modelseed_reactions_data[modelseed_reaction_id] = modelseed_reaction_data
-        if new_ec_numbers:
-            # Each row of the table represents a unique EC number -> ModelSEED reaction mapping.
-            modelseed_ec_reactions_dict: Dict[str, Dict] = modelseed_ec_reactions_table[
-                modelseed_ec_reactions_table['EC_number'].isin(new_ec_numbers)
-            ].to_dict(orient='index')
-            for modelseed_reaction_data in modelseed_ec_reactions_dict.values():
-                ec_number = modelseed_reaction_data['EC_number']
-                modelseed_reaction_id = modelseed_reaction_data['id']
+        for ec_number in new_ec_numbers:
+            try:
+                row_indices = ec_number_lookup[ec_number]
+            except KeyError:
+                # The EC number does not alias any ModelSEED reactions.
+                continue
+            for row_index in row_indices:
+                modelseed_reaction_data = modelseed_reaction_rows[row_index]
+                modelseed_reaction_id = modelseed_reaction_data.id
                 # Record the association between the EC number and ModelSEED reaction in the
                 # network, and vice versa.
-                network.ec_number_modelseed_aliases[ec_number].append(modelseed_reaction_id)
+                ec_number_modelseed_aliases[ec_number].append(modelseed_reaction_id)
                 try:
-                    network.modelseed_ec_number_aliases[modelseed_reaction_id].append(ec_number)
+                    modelseed_ec_number_aliases[modelseed_reaction_id].append(ec_number)
                 except KeyError:
                     # This is the first time the ModelSEED reaction has been encountered.
-                    network.modelseed_ec_number_aliases[modelseed_reaction_id] = [ec_number]
-                    network.modelseed_kegg_aliases[modelseed_reaction_id] = []
+                    modelseed_ec_number_aliases[modelseed_reaction_id] = [ec_number]
+                    modelseed_kegg_aliases[modelseed_reaction_id] = []
                 if modelseed_reaction_id in modelseed_reactions_data:
                     # One of the other newly encountered KEGG reactions or EC numbers also
                     # mapped to this ModelSEED reaction, so do not record redundant ModelSEED reaction data.
@@ -6925,7 +6991,7 @@ class Constructor:
         new_kegg_reaction_ids: List[str],
         new_ec_numbers: List[str],
         modelseed_compound_ids: List[str],
-        modelseed_compounds_table: pd.DataFrame
+        modelseed_compound_rows: Dict[str, tuple]
     ) -> None:
         """
         Add an object representing the ModelSEED reaction and objects representing associated
@@ -6951,8 +7017,9 @@ class Constructor:
         modelseed_compound_ids : List[str]
             ModelSEED compound IDs of the reactants and products in the reaction.
 
-        modelseed_compounds_table : pd.DataFrame
-            Loaded ModelSEED Biochemistry compounds database.
+        modelseed_compound_rows : Dict[str, tuple]
+            Rows of the loaded ModelSEED Biochemistry compounds database, as namedtuples keyed by
+            ModelSEED compound ID.
 
         Returns
         =======
@@ -6962,10 +7029,10 @@ class Constructor:
         ko.reactions[modelseed_reaction_id] = reaction
         # Record which KEGG REACTION IDs and EC numbers from the KO yield the ModelSEED reaction.
         ko.kegg_reaction_aliases[modelseed_reaction_id] = list(
-            set(new_kegg_reaction_ids).intersection(set(reaction.kegg_aliases))
+            reaction.kegg_aliases.intersection(new_kegg_reaction_ids)
         )
         ko.ec_number_aliases[modelseed_reaction_id] = list(
-            set(new_ec_numbers).intersection(set(reaction.ec_number_aliases))
+            reaction.ec_number_aliases.intersection(new_ec_numbers)
         )
         network.reactions[modelseed_reaction_id] = reaction
 
@@ -6979,7 +7046,7 @@ class Constructor:
 
             # Generate new metabolite objects in the network.
             try:
-                modelseed_compound_series = modelseed_compounds_table.loc[modelseed_compound_id]
+                modelseed_compound_data = modelseed_compound_rows[modelseed_compound_id]
             except KeyError:
                 raise ConfigError(
                     f"""\
@@ -6988,9 +7055,6 @@ class Constructor:
                     for the ModelSEED reaction, '{modelseed_reaction_id}'.\
                     """
                 )
-            modelseed_compound_series: pd.Series
-            modelseed_compound_data = modelseed_compound_series.to_dict()
-            modelseed_compound_data['id'] = modelseed_compound_id
             compound = self._get_modelseed_compound(modelseed_compound_data)
             reaction_compounds.append(compound)
             network.metabolites[modelseed_compound_id] = compound
@@ -6998,7 +7062,8 @@ class Constructor:
 
     def _get_modelseed_reaction(
         self,
-        modelseed_reaction_data: Dict
+        modelseed_reaction_data: tuple,
+        stoichiometries: Dict[str, List[List[str]]] = None
     ) -> Tuple[ModelSEEDReaction, List[str]]:
         """
         Generate a ModelSEED reaction object and list of associated ModelSEED compound IDs from the
@@ -7007,9 +7072,14 @@ class Constructor:
 
         Parameters
         ==========
-        modelseed_reaction_data : Dict
-            A dictionary representation of a row for a reaction in the ModelSEED reaction table set
-            up by anvi'o.
+        modelseed_reaction_data : tuple
+            A namedtuple representation of a row for a reaction in the ModelSEED reaction table set
+            up by anvi'o, with column values accessed as attributes.
+
+        stoichiometries : Dict[str, List[List[str]]], None
+            Stoichiometry entries split in advance by the ModelSEED database, keyed by reaction ID.
+            With the default value of None, the stoichiometry string in 'modelseed_reaction_data'
+            is split here instead.
 
         Returns
         =======
@@ -7019,41 +7089,48 @@ class Constructor:
         List[str]
             ModelSEED compound IDs of reactants and products.
         """
-        stoichiometry: str = modelseed_reaction_data['stoichiometry']
-        if pd.isna(stoichiometry):
-            # ignore any reaction lacking a chemical equation for some reason
-            return None, None
+        if stoichiometries is None:
+            stoichiometry: str = modelseed_reaction_data.stoichiometry
+            if is_na(stoichiometry):
+                # ignore any reaction lacking a chemical equation for some reason
+                return None, None
+            split_stoichiometry = [entry.split(':', 3) for entry in stoichiometry.split(';')]
+        else:
+            split_stoichiometry = stoichiometries.get(modelseed_reaction_data.id)
+            if split_stoichiometry is None:
+                # ignore any reaction lacking a chemical equation for some reason
+                return None, None
 
         reaction = ModelSEEDReaction()
 
-        modelseed_id = modelseed_reaction_data['id']
-        if pd.isna(modelseed_id):
+        modelseed_id = modelseed_reaction_data.id
+        if is_na(modelseed_id):
             raise ConfigError(
                 "The row for the reaction in the ModelSEED table does not but should have an ID. "
                 f"Here is the data in the row: '{modelseed_reaction_data}'"
             )
         reaction.modelseed_id = modelseed_id
 
-        modelseed_name = modelseed_reaction_data['name']
-        if pd.isna(modelseed_name):
+        modelseed_name = modelseed_reaction_data.name
+        if is_na(modelseed_name):
             reaction.modelseed_name = None
         else:
             reaction.modelseed_name = modelseed_name
 
-        kegg_reaction_ids: str = modelseed_reaction_data['KEGG']
-        if pd.isna(kegg_reaction_ids):
-            reaction.kegg_aliases = tuple()
+        kegg_reaction_ids: str = modelseed_reaction_data.KEGG
+        if is_na(kegg_reaction_ids):
+            reaction.kegg_aliases = frozenset()
         else:
-            reaction.kegg_aliases = tuple(kegg_reaction_ids.split('; '))
+            reaction.kegg_aliases = frozenset(kegg_reaction_ids.split('; '))
 
-        ec_numbers: str = modelseed_reaction_data['ec_numbers']
-        if pd.isna(ec_numbers):
-            reaction.ec_number_aliases = []
+        ec_numbers: str = modelseed_reaction_data.ec_numbers
+        if is_na(ec_numbers):
+            reaction.ec_number_aliases = frozenset()
         else:
-            reaction.ec_number_aliases = ec_numbers.split('|')
+            reaction.ec_number_aliases = frozenset(ec_numbers.split('|'))
 
-        reversibility = modelseed_reaction_data['reversibility']
-        if pd.isna(reversibility):
+        reversibility = modelseed_reaction_data.reversibility
+        if is_na(reversibility):
             raise ConfigError(
                 "The row for the reaction in the ModelSEED table was expected to have a 'reversibility' value. "
                 f"Here is the data in the row: '{modelseed_reaction_data}'"
@@ -7065,18 +7142,22 @@ class Constructor:
             reaction.reversibility = False
 
         decimal_reaction_coefficients = []
-        split_stoichiometry = stoichiometry.split(';')
         modelseed_compound_ids = []
         compartments = []
-        for entry in split_stoichiometry:
-            split_entry = entry.split(':')
-            decimal_reaction_coefficients.append(split_entry[0])
-            modelseed_compound_ids.append(split_entry[1])
-            compartments.append(ModelSEEDDatabase.compartment_ids[int(split_entry[2])])
+        # Bind the compartment lookup and append methods to local names outside the loop, sparing
+        # repeated attribute resolution in this innermost parsing loop.
+        compartment_ids = ModelSEEDDatabase.compartment_ids
+        append_coefficient = decimal_reaction_coefficients.append
+        append_compound_id = modelseed_compound_ids.append
+        append_compartment = compartments.append
+        for split_entry in split_stoichiometry:
+            append_coefficient(split_entry[0])
+            append_compound_id(split_entry[1])
+            append_compartment(compartment_ids[int(split_entry[2])])
         reaction.compartments = tuple(compartments)
         reaction_coefficients = to_lcm_denominator(decimal_reaction_coefficients)
-        direction = modelseed_reaction_data['direction']
-        if pd.isna(direction):
+        direction = modelseed_reaction_data.direction
+        if is_na(direction):
             raise ConfigError(
                 "The row for the reaction in the ModelSEED table was expected to have a 'direction' value. "
                 f"Here is the data in the row: '{modelseed_reaction_data}'"
@@ -7088,15 +7169,16 @@ class Constructor:
 
         return reaction, modelseed_compound_ids
 
-    def _get_modelseed_compound(self, modelseed_compound_data: Dict) -> ModelSEEDCompound:
+    def _get_modelseed_compound(self, modelseed_compound_data: tuple) -> ModelSEEDCompound:
         """
         Generate a ModelSEED compound object from its entry in the ModelSEED table.
 
         Parameters
         ==========
-        modelseed_compound_data : Dict
-            A dictionary representation of a row for a compound in the ModelSEED compound table set
-            up by anvi'o.
+        modelseed_compound_data : tuple
+            A namedtuple representation of a row for a compound in the ModelSEED compound table set
+            up by anvi'o, with the compound ID accessed as the 'Index' attribute and column values
+            accessed as attributes.
 
         Returns
         =======
@@ -7104,29 +7186,29 @@ class Constructor:
             An object representation of the ModelSEED compound.
         """
         compound = ModelSEEDCompound()
-        compound.modelseed_id = modelseed_compound_data['id']
+        compound.modelseed_id = modelseed_compound_data.Index
 
-        modelseed_name = modelseed_compound_data['name']
-        if pd.isna(modelseed_name):
+        modelseed_name = modelseed_compound_data.name
+        if is_na(modelseed_name):
             compound.modelseed_name = None
         else:
             compound.modelseed_name = modelseed_name
 
-        kegg_aliases: str = modelseed_compound_data['KEGG']
-        if pd.isna(kegg_aliases):
+        kegg_aliases: str = modelseed_compound_data.KEGG
+        if is_na(kegg_aliases):
             compound.kegg_aliases = tuple()
         else:
             compound.kegg_aliases = tuple(kegg_aliases.split('; '))
 
-        formula = modelseed_compound_data['formula']
-        if pd.isna(formula):
+        formula = modelseed_compound_data.formula
+        if is_na(formula):
             compound.formula = None
             # compounds without formulas have a nominal charge of 10000000 in compounds.tsv
             compound.charge = None
         else:
             compound.formula = formula
-            charge = modelseed_compound_data['charge']
-            if pd.isna(charge):
+            charge = modelseed_compound_data.charge
+            if is_na(charge):
                 raise ConfigError(
                     f"The charge of a ModelSEED compound, '{compound.modelseed_id}', was not recorded "
                     "in 'compounds.tsv' but is expected to be present as an integer. Here is the data "
@@ -7136,7 +7218,7 @@ class Constructor:
 
         return compound
 
-    def _get_database_reactions_table(self, network: ReactionNetwork) -> pd.DataFrame:
+    def _get_database_reactions_table(self, network: ReactionNetwork) -> List[Tuple]:
         """
         Make a reactions table that can be stored in either a contigs or pan database, as the tables
         have the same structure. A `ReactionNetwork` can be reconstructed with the same data from
@@ -7149,8 +7231,9 @@ class Constructor:
 
         Returns
         =======
-        pd.DataFrame
-            The table of reactions data to be stored in the contigs or pan database.
+        list
+            The rows of reactions data to be stored in the contigs or pan database, ordered per
+            the table structure.
         """
         assert tables.gene_function_reactions_table_structure == tables.pan_gene_cluster_function_reactions_table_structure
         assert tables.gene_function_reactions_table_types == tables.pan_gene_cluster_function_reactions_table_types
@@ -7161,17 +7244,17 @@ class Constructor:
             reaction_data = {}
             reaction_data['modelseed_reaction_id'] = modelseed_reaction_id
             reaction_data['modelseed_reaction_name'] = reaction.modelseed_name
-            reaction_data['metabolite_modelseed_ids'] = ', '.join([c.modelseed_id for c in reaction.compounds])
-            reaction_data['stoichiometry'] = ', '.join([str(c) for c in reaction.coefficients])
+            reaction_data['metabolite_modelseed_ids'] = ', '.join(c.modelseed_id for c in reaction.compounds)
+            reaction_data['stoichiometry'] = ', '.join(map(str, reaction.coefficients))
             reaction_data['compartments'] = ', '.join(reaction.compartments)
             reaction_data['reversibility'] = reaction.reversibility
             # Record KEGG REACTION IDs and EC numbers that are aliases of ModelSEED reactions but
             # are *NOT* associated with gene KO annotations; associated aliases are recorded later.
             reaction_data['other_kegg_reaction_ids'] = ', '.join(
-                set(reaction.kegg_aliases).difference(set(network.modelseed_kegg_aliases[modelseed_reaction_id]))
+                reaction.kegg_aliases.difference(network.modelseed_kegg_aliases[modelseed_reaction_id])
             )
             reaction_data['other_ec_numbers'] = ', '.join(
-                set(reaction.ec_number_aliases).difference(set(network.modelseed_ec_number_aliases[modelseed_reaction_id]))
+                reaction.ec_number_aliases.difference(network.modelseed_ec_number_aliases[modelseed_reaction_id])
             )
             reactions_data[modelseed_reaction_id] = reaction_data
 
@@ -7189,7 +7272,8 @@ class Constructor:
         # ...
         # }
         ko_reaction_aliases: Dict[str, Tuple[Dict[str, List[str]], Dict[str, List[str]]]] = {
-            modelseed_reaction_id: ({}, {}) for modelseed_reaction_id in reactions_data
+            modelseed_reaction_id: (collections.defaultdict(list), collections.defaultdict(list))
+            for modelseed_reaction_id in reactions_data
         }
         for ko_id, ko in network.kos.items():
             for modelseed_reaction_id, reaction in ko.reactions.items():
@@ -7198,44 +7282,39 @@ class Constructor:
                 kegg_reaction_aliases = aliases[0]
                 kegg_reaction_ids = ko.kegg_reaction_aliases[modelseed_reaction_id]
                 for kegg_reaction_id in kegg_reaction_ids:
-                    try:
-                        ko_ids: List = kegg_reaction_aliases[kegg_reaction_id]
-                    except KeyError:
-                        kegg_reaction_aliases[kegg_reaction_id] = ko_ids = []
-                    ko_ids.append(ko_id)
+                    kegg_reaction_aliases[kegg_reaction_id].append(ko_id)
 
                 ec_number_aliases = aliases[1]
                 ec_numbers = ko.ec_number_aliases[modelseed_reaction_id]
                 for ec_number in ec_numbers:
-                    try:
-                        ko_ids: List = ec_number_aliases[ec_number]
-                    except KeyError:
-                        ec_number_aliases[ec_number] = ko_ids = []
-                    ko_ids.append(ko_id)
+                    ec_number_aliases[ec_number].append(ko_id)
         for modelseed_reaction_id, aliases in ko_reaction_aliases.items():
             reaction_data = reactions_data[modelseed_reaction_id]
 
             # Make the entry for KO KEGG REACTION aliases, which looks akin to the following arbitrary example:
             # 'R00001: (K00010, K00100); R01234: (K54321)'
             kegg_reaction_aliases = aliases[0]
-            entry = []
-            for kegg_reaction_id, ko_ids in kegg_reaction_aliases.items():
-                entry.append(f'{kegg_reaction_id}: ({", ".join(sorted(ko_ids))})')
-            reaction_data['ko_kegg_reaction_source'] = '; '.join(sorted(entry))
+            reaction_data['ko_kegg_reaction_source'] = '; '.join(sorted(
+                f'{kegg_reaction_id}: ({", ".join(sorted(ko_ids))})'
+                for kegg_reaction_id, ko_ids in kegg_reaction_aliases.items()
+            ))
 
             # Make the entry for KO EC number aliases, which looks akin to the following arbitrary example:
             # '1.1.1.1: (K00010, K00100); 1.2.3.4: (K12345); 6.7.8.99: (K65432)
             ec_number_aliases = aliases[1]
-            entry = []
-            for ec_number, ko_ids in ec_number_aliases.items():
-                entry.append(f'{ec_number}: ({", ".join(sorted(ko_ids))})')
-            reaction_data['ko_ec_number_source'] = '; '.join(sorted(entry))
-
-        reactions_table = pd.DataFrame.from_dict(reactions_data, orient='index').reset_index(drop=True).sort_values('modelseed_reaction_id')
-        reactions_table = reactions_table[tables.gene_function_reactions_table_structure]
+            reaction_data['ko_ec_number_source'] = '; '.join(sorted(
+                f'{ec_number}: ({", ".join(sorted(ko_ids))})'
+                for ec_number, ko_ids in ec_number_aliases.items()
+            ))
+
+        table_structure = tables.gene_function_reactions_table_structure
+        reactions_table = [
+            tuple(reaction_data[column] for column in table_structure)
+            for modelseed_reaction_id, reaction_data in sorted(reactions_data.items())
+        ]
         return reactions_table
 
-    def _get_database_metabolites_table(self, network: ReactionNetwork) -> pd.DataFrame:
+    def _get_database_metabolites_table(self, network: ReactionNetwork) -> List[Tuple]:
         """
         Make a metabolites table that can be stored in either a contigs or pan database, as the tables
         have the same structure. A `ReactionNetwork` can be reconstructed with the same data from
@@ -7248,25 +7327,21 @@ class Constructor:
 
         Returns
         =======
-        pd.DataFrame
-            The table of metabolites data to be stored in the contigs or pan database.
+        list
+            The rows of metabolites data to be stored in the contigs or pan database, ordered per
+            the table structure.
         """
         assert tables.gene_function_metabolites_table_structure == tables.pan_gene_cluster_function_metabolites_table_structure
         assert tables.gene_function_metabolites_table_types == tables.pan_gene_cluster_function_metabolites_table_types
 
-        # Transfer data from metabolite objects to dictionaries mapping to table entries.
-        metabolites_data = {}
-        for modelseed_compound_id, compound in network.metabolites.items():
-            metabolite_data = {}
-            metabolite_data['modelseed_compound_id'] = modelseed_compound_id
-            metabolite_data['modelseed_compound_name'] = compound.modelseed_name
-            metabolite_data['kegg_aliases'] = ', '.join(compound.kegg_aliases)
-            metabolite_data['formula'] = compound.formula
-            metabolite_data['charge'] = compound.charge
-            metabolites_data[modelseed_compound_id] = metabolite_data
-
-        metabolites_table = pd.DataFrame.from_dict(metabolites_data, orient='index').reset_index(drop=True).sort_values('modelseed_compound_id')
-        metabolites_table = metabolites_table[tables.gene_function_metabolites_table_structure]
+        # Transfer data from metabolite objects to rows of the table.
+        get_compound_attributes = attrgetter('modelseed_name', 'kegg_aliases', 'formula', 'charge')
+        metabolites_table = []
+        for modelseed_compound_id, compound in sorted(network.metabolites.items()):
+            modelseed_name, kegg_aliases, formula, charge = get_compound_attributes(compound)
+            metabolites_table.append(
+                (modelseed_compound_id, modelseed_name, ', '.join(kegg_aliases), formula, charge)
+            )
         return metabolites_table
 
     def hash_contigs_db_ko_annotations(self, gene_function_calls_dict: Dict) -> str:
@@ -7291,13 +7366,13 @@ class Constructor:
             ko_name = ko_data[1]
             e_value = ko_data[2]
             ko_annotations.append((str(gcid), ko_id, ko_name, str(e_value)))
-        ko_annotations = sorted(ko_annotations, key=lambda x: (x[0], x[1]))
+        ko_annotations.sort(key=itemgetter(0, 1))
 
-        ko_annotations_string = ''
+        sha1 = hashlib.sha1()
         for ko_annotation in ko_annotations:
-            ko_annotations_string += ''.join(ko_annotation)
-
-        hashed_ko_annotations = hashlib.sha1(ko_annotations_string.encode('utf-8')).hexdigest()
+            for item in ko_annotation:
+                sha1.update(item.encode('utf-8'))
+        hashed_ko_annotations = sha1.hexdigest()
         return hashed_ko_annotations
 
     def hash_pan_db_ko_annotations(
@@ -7338,7 +7413,7 @@ class Constructor:
         ko_annotations = []
         for row in functions_table.itertuples(index=False):
             ko_annotations.append((row.genome_name, str(row.gene_callers_id), row.accession, row.function, str(row.e_value)))
-        ko_annotations = sorted(ko_annotations, key=lambda x: (x[0], x[1], x[2]))
+        ko_annotations.sort(key=itemgetter(0, 1, 2))
 
         ko_annotations = []
         for cluster_id, gene_cluster_dict in gene_clusters_functions_summary_dict.items():
@@ -7347,13 +7422,13 @@ class Constructor:
             ko_name = ko_data['function']
             # When the KO ID and name are None, convert them into 'None'.
             ko_annotations.append((str(cluster_id), str(ko_id), str(ko_name)))
-        ko_annotations = sorted(ko_annotations, key=lambda x: x[0])
+        ko_annotations.sort(key=itemgetter(0))
 
-        ko_annotations_string = f'{consensus_threshold}_{int(discard_ties)}_'
+        sha1 = hashlib.sha1(f'{consensus_threshold}_{int(discard_ties)}_'.encode('utf-8'))
         for ko_annotation in ko_annotations:
-            ko_annotations_string += ''.join(ko_annotation)
-
-        hashed_ko_annotations = hashlib.sha1(ko_annotations_string.encode('utf-8')).hexdigest()
+            for item in ko_annotation:
+                sha1.update(item.encode('utf-8'))
+        hashed_ko_annotations = sha1.hexdigest()
         return hashed_ko_annotations
 
 class Tester:
@@ -7960,6 +8035,112 @@ def get_chemical_equation(reaction: ModelSEEDReaction) -> str:
 
     return equation.rstrip('+ ')
 
+def is_na(value: Any) -> bool:
+    """
+    Cheaply check whether a scalar value from a reference table is missing (None or NaN).
+
+    This avoids the type-dispatching overhead of 'pd.isna' in methods that check many fields per
+    row across tens of thousands of rows. NaN is the only value that does not equal itself.
+
+    Parameters
+    ==========
+    value : Any
+        The scalar value to check.
+
+    Returns
+    =======
+    bool
+        True if the value is None or NaN.
+    """
+    return value is None or value != value
+
+def read_tabular_data_file(path: str, index_col: str = None, usecols: List[str] = None) -> pd.DataFrame:
+    """
+    Read a tab-delimited data file, such as a reference KO or ModelSEED Biochemistry table, into a
+    DataFrame.
+
+    The PyArrow CSV reader is used when the optional 'pyarrow' package is installed, as it parses
+    in parallel and produces the DataFrame without the memory overhead of the pandas reader. The
+    pandas reader is the fallback.
+
+    Parameters
+    ==========
+    path : str
+        Path to the tab-delimited file.
+
+    index_col : str, None
+        Name of the column to set as the DataFrame index. With the default value of None, the first
+        column of the file is used as the index if it has an empty name, which is how anvi'o writes
+        tables indexed by ID; otherwise, a default integer index is used.
+
+    usecols : List[str], None
+        Names of the columns to load, which should include 'index_col' if that is also provided.
+        Unlisted columns are neither parsed nor stored. With the default value of None, every
+        column of the file is loaded.
+
+    Returns
+    =======
+    pd.DataFrame
+        The loaded table.
+    """
+    # A Parquet copy of the parsed table is kept beside the tab-delimited file so that repeated
+    # loads (a new table is parsed every time a network is constructed or loaded) skip CSV
+    # tokenization entirely. The cache is only usable when pyarrow is installed, and is refreshed
+    # whenever the tab-delimited file is newer, e.g., after the reference database is set up again.
+    cache_path = f'{os.path.splitext(path)[0]}.parquet'
+    if (
+        pyarrow_csv is not None and
+        os.path.isfile(cache_path) and
+        os.path.getmtime(cache_path) > os.path.getmtime(path)
+    ):
+        try:
+            return pd.read_parquet(cache_path, columns=usecols)
+        except Exception:
+            # An unreadable cache -- say, one written by an incompatible pyarrow or pandas after an
+            # environment upgrade -- should never block loading the reference table: fall through
+            # to parse the tab-delimited file, which also refreshes the cache.
+            pass
+
+    if pyarrow_csv is None:
+        table = pd.read_csv(path, sep='\t', header=0, usecols=usecols, low_memory=False)
+    else:
+        table = pyarrow_csv.read_csv(
+            path,
+            parse_options=pyarrow_csv.ParseOptions(delimiter='\t'),
+            # Unlike the pandas reader, PyArrow does not null-check string columns unless told to:
+            # 'strings_can_be_null' makes empty and 'null' fields load as missing values rather
+            # than literal strings, matching what the pandas reader produces.
+            convert_options=pyarrow_csv.ConvertOptions(strings_can_be_null=True, include_columns=usecols)
+        ).to_pandas(split_blocks=True, self_destruct=True)
+
+    if index_col is not None:
+        table = table.set_index(index_col)
+    elif table.columns[0] in ('', 'Unnamed: 0'):
+        table = table.set_index(table.columns[0])
+        table.index.name = None
+
+    if pyarrow_csv is not None:
+        temporary_cache_path = None
+        try:
+            # Write to a uniquely named temporary file and rename into place so that a process
+            # killed mid-write cannot leave a truncated cache with a fresh mtime, and concurrent
+            # processes caching the same table cannot write through the same path.
+            temporary_cache_handle, temporary_cache_path = tempfile.mkstemp(
+                dir=os.path.dirname(cache_path), suffix='.parquet.tmp'
+            )
+            os.close(temporary_cache_handle)
+            table.to_parquet(temporary_cache_path)
+            os.replace(temporary_cache_path, cache_path)
+        except OSError:
+            # The reference database directory need not be writable to load tables from it.
+            if temporary_cache_path is not None and os.path.isfile(temporary_cache_path):
+                try:
+                    os.remove(temporary_cache_path)
+                except OSError:
+                    pass
+
+    return table
+
 def to_lcm_denominator(floats: Iterable[float]) -> Tuple[int]:
     """
     Convert a list of floats to a list of integers, with a list containing fractional numbers
@@ -7975,13 +8156,31 @@ def to_lcm_denominator(floats: Iterable[float]) -> Tuple[int]:
     List[int]
         List of integers transformed from the input list.
     """
-    def lcm(a, b):
-        return a * b // math.gcd(a, b)
+    rationals = [_to_fraction(f) for f in floats]
+    lcm_denom = math.lcm(*(r.denominator for r in rationals))
+
+    return [r.numerator * (lcm_denom // r.denominator) for r in rationals]
+
+@functools.lru_cache(maxsize=4096)
+def _to_fraction(number) -> fractions.Fraction:
+    """
+    Convert a number, such as a decimal string, to its exact rational representation.
 
-    rationals = [fractions.Fraction(f).limit_denominator() for f in floats]
-    lcm_denom = functools.reduce(lcm, [r.denominator for r in rationals])
+    Conversions are cached: the same small set of stoichiometric coefficients, e.g., '1', '2',
+    '0.5', recurs across the tens of thousands of reactions parsed from the ModelSEED table, and
+    Fraction construction is far more costly than a cache hit.
 
-    return list(int(r.numerator * lcm_denom / r.denominator) for r in rationals)
+    Parameters
+    ==========
+    number : Any
+        The number to convert.
+
+    Returns
+    =======
+    fractions.Fraction
+        The rational representation of the number.
+    """
+    return fractions.Fraction(number).limit_denominator()
 
 def _download_worker(
     input_queue: mp.Queue,
@@ -3,7 +3,7 @@
 """This file contains CAZyme related classes."""
 
 import os
-import glob
+import sys
 import shutil
 
 import anvio
@@ -220,20 +220,21 @@ class CAZyme(object):
     def is_database_exists(self):
         """Checks if decompressed database files exist"""
 
-        if not glob.glob(self.cazyme_data_dir):
+        if not os.path.exists(self.cazyme_data_dir):
             raise ConfigError("It seems the CAZyme database is not setup on this system :/ Please run the program "
                               "`anvi-setup-cazymes` to set it up. If you set up CAZyme database at a location that "
                               "is different than the default location using the `--cazyme-data-dir` flag before, "
                               "please makes sure to provide the same path to `anvi-run-cazymes`.")
 
-        # Glob and find what files we have then check if we have them all
-        downloaded_files = glob.glob(os.path.join(self.cazyme_data_dir, '*'))
+        # Scan the directory once and find what files we have then check if we have them all
+        with os.scandir(self.cazyme_data_dir) as directory_entries:
+            downloaded_files = [entry.name for entry in directory_entries if entry.is_file()]
 
         # here we check if the HMM profile is compressed so we can decompress it for next time
-        hmmpress_file_extensions = ["h3f", "h3i", "h3m", "h3p", "txt"]
-        extant_extensions = [os.path.basename(file).split(".")[-1] for file in downloaded_files]
+        hmmpress_file_extensions = {"h3f", "h3i", "h3m", "h3p", "txt"}
+        extant_extensions = {file.rsplit(".", 1)[-1] for file in downloaded_files}
 
-        if hmmpress_file_extensions.sort() != extant_extensions.sort() or not os.path.exists(self.version_txt) or not os.path.exists(self.db_url_txt):
+        if not hmmpress_file_extensions.issubset(extant_extensions) or not os.path.exists(self.version_txt) or not os.path.exists(self.db_url_txt):
             raise ConfigError("Something is not right with the files associated with the CAZyme database. Please run "
                               "'anvi-setup-cazymes --reset' to repeat the setup.")
 
@@ -243,23 +244,18 @@ class CAZyme(object):
 
         self.run.info("CAZyme database version", f"{self.db_version} (originally from {self.db_url})" )
 
-        # initialize contigs database
-        class Args: pass
-        args = Args()
-        args.contigs_db = self.contigs_db_path
-        run_quiet = terminal.Run(verbose=False)
-
-        contigs_db = dbops.ContigsSuperclass(args, r=run_quiet)
         tmp_directory_path = filesnpaths.get_temp_directory_path()
+        run_quiet = terminal.Run(verbose=False)
 
         # get an instance of gene functions table
         gene_function_calls_table = TableForGeneFunctions(self.contigs_db_path)
 
-        # export AA sequences for genes
+        # export AA sequences for genes straight from the contigs database, which avoids
+        # initializing the full contigs superclass just for a FASTA file
         target_files_dict = {'AA:GENE': os.path.join(tmp_directory_path, 'AA_gene_sequences.fa')}
-        contigs_db.get_sequences_for_gene_callers_ids(output_file_path=target_files_dict['AA:GENE'],
-                                                      simple_headers=True,
-                                                      report_aa_sequences=True)
+        dbops.export_aa_sequences_from_contigs_db(self.contigs_db_path,
+                                                  target_files_dict['AA:GENE'],
+                                                  run=run_quiet)
 
         # run hmmer
         hmmer = HMMer(target_files_dict, num_threads_to_use=self.num_threads, program_to_use=self.hmm_program)
@@ -278,22 +274,17 @@ class CAZyme(object):
         parser = parser_modules['search']['hmmer_table_output'](hmm_hits_file, alphabet='AA', context='GENE', program=self.hmm_program)
         search_results_dict = parser.get_search_results()
 
-        # add functions to database
-        functions_dict = {}
-        counter = 0
-        for hmm_hit in search_results_dict.values():
-            functions_dict[counter] = {
-                'gene_callers_id': hmm_hit['gene_callers_id'],
-                'source': 'CAZyme',
-                'accession': hmm_hit['gene_hmm_id'],
-                'function': hmm_hit['gene_name'],
-                'e_value': hmm_hit['e_value']
-            }
-
-            counter += 1
-
-        if functions_dict:
-            gene_function_calls_table.create(functions_dict)
+        # add functions to database as rows ordered per the gene function calls table structure.
+        # CAZyme family names and accessions repeat across very many hits, so interning collapses
+        # the duplicate strings to single objects
+        intern = sys.intern
+        db_entries = [
+            (hmm_hit['gene_callers_id'], 'CAZyme', intern(hmm_hit['gene_hmm_id']), intern(hmm_hit['gene_name']), hmm_hit['e_value'])
+            for hmm_hit in search_results_dict.values()
+        ]
+
+        if db_entries:
+            gene_function_calls_table.create_from_entries(db_entries)
         else:
             self.run.warning("CAZyme class has no hits to process. Returning empty handed, but still adding CAZyme as "
                              "a functional source.")
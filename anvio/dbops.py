@@ -4980,6 +4980,45 @@ def get_auxiliary_data_path_for_profile_db(profile_db_path):
     return os.path.join(os.path.dirname(profile_db_path), 'AUXILIARY-DATA.db')
 
 
+def export_aa_sequences_from_contigs_db(contigs_db_path, output_file_path, wrap=120, run=run):
+    """Store amino acid sequences for all gene calls in a contigs database as a FASTA file with
+    gene caller ids as simple deflines.
+
+    This is a lightweight alternative to calling `get_sequences_for_gene_callers_ids` with
+    `simple_headers=True` and `report_aa_sequences=True` on a `ContigsSuperclass` instance for
+    those who only need the FASTA output: it reads the gene amino acid sequences table directly
+    rather than initializing gene calls and contig sequences through the superclass."""
+
+    utils.is_contigs_db(contigs_db_path)
+    filesnpaths.is_output_file_writable(output_file_path)
+
+    contigs_db = ContigsDatabase(contigs_db_path)
+    aa_sequences_dict = contigs_db.db.get_table_as_dict(t.gene_amino_acid_sequences_table_name)
+    contigs_db.disconnect()
+
+    skipped_gene_calls = []
+    with open(output_file_path, 'w') as output:
+        for gene_callers_id in sorted(aa_sequences_dict):
+            sequence = aa_sequences_dict[gene_callers_id]['sequence']
+
+            if not sequence:
+                skipped_gene_calls.append(gene_callers_id)
+                continue
+
+            if wrap:
+                sequence = textwrap.fill(sequence, wrap, break_on_hyphens=False)
+
+            output.write('>%s\n' % gene_callers_id)
+            output.write('%s\n' % sequence)
+
+    run.info('Output FASTA', output_file_path)
+
+    if len(skipped_gene_calls):
+        run.warning("Gene caller IDs %s have empty AA sequences and skipped." % (", ".join(map(str, skipped_gene_calls))))
+
+    return output_file_path
+
+
 def get_description_in_db(anvio_db_path, run=run):
     """Reads the description in an anvi'o database"""
 
@@ -54,6 +54,18 @@ progress_quiet = terminal.Progress(verbose=False)
 pp = terminal.pretty_print
 P = terminal.pluralize
 
+# Compiled patterns for parsing KEGG module files. These run once per line of every module file
+# during setup, so they are compiled here rather than looked up through the re cache on each call.
+KEGG_DEFINITION_SPLIT_PATTERN = re.compile(r'[()+, \-]')
+KEGG_ORTHOLOGY_SPLIT_PATTERN = re.compile(r'[(),+\-]')
+KEGG_REACTION_SPLIT_PATTERN = re.compile(r'[,+]')
+KEGG_KNUM_PATTERN = re.compile(r'K\d{5}')
+# grammars matching entirely well-formed DEFINITION/ORTHOLOGY value strings, ie delimiters and
+# K/M numbers only. A single fullmatch on one of these short-circuits per-token validation for
+# the overwhelmingly common case of a correctly-formatted line
+KEGG_DEFINITION_GRAMMAR_PATTERN = re.compile(r'[()+, \-]*[KM]\d{5}(?:[()+, \-]+[KM]\d{5})*[()+, \-]*')
+KEGG_ORTHOLOGY_GRAMMAR_PATTERN = re.compile(r'[(),+\-]*[KM]\d{5}(?:[(),+\-]+[KM]\d{5})*[(),+\-]*')
+
 
 """Some critical constants for metabolism estimation output formatting.
 
@@ -7444,20 +7456,22 @@ class ModulesDatabase(KeggContext):
         elif current_data_name == "DEFINITION":
             # example format: (K01647,K05942) (K01681,K01682) (K00031,K00030) (K00164+K00658+K00382,K00174+K00175-K00177-K00176)
             # another example: (M00161,M00163) M00165
-            knums = [x for x in re.split('\(|\)|,| |\+|-',data_vals) if x]
-            for k in knums:
-                if k[0] not in ['K','M'] or len(k) != 6:
-                    is_ok = False
-            if not is_ok: # this goes here to avoid counting multiple errors for the same line
-                self.parsing_error_dict['bad_kegg_code_format'].append(current_module_num)
+            if not KEGG_DEFINITION_GRAMMAR_PATTERN.fullmatch(data_vals):
+                knums = [x for x in KEGG_DEFINITION_SPLIT_PATTERN.split(data_vals) if x]
+                for k in knums:
+                    if k[0] not in ['K','M'] or len(k) != 6:
+                        is_ok = False
+                if not is_ok: # this goes here to avoid counting multiple errors for the same line
+                    self.parsing_error_dict['bad_kegg_code_format'].append(current_module_num)
         elif current_data_name == "ORTHOLOGY":
             # example format: K00234,K00235,K00236,K00237
             # more complex example: (K00163,K00161+K00162)+K00627+K00382-K13997
             # another example:  (M00161         [ie, from (M00161  Photosystem II)]
-            knums = [x for x in re.split('\(|\)|,|\+|-', data_vals) if x]
-            for k in knums:
-                if k[0] not in ['K','M'] or len(k) != 6:
-                    is_ok = False
+            if not KEGG_ORTHOLOGY_GRAMMAR_PATTERN.fullmatch(data_vals):
+                knums = [x for x in KEGG_ORTHOLOGY_SPLIT_PATTERN.split(data_vals) if x]
+                for k in knums:
+                    if k[0] not in ['K','M'] or len(k) != 6:
+                        is_ok = False
             # try to fix it by splitting on first space
             if not is_ok:
                 self.parsing_error_dict['bad_line_splitting'].append(current_module_num)
@@ -7465,7 +7479,7 @@ class ModulesDatabase(KeggContext):
                 corrected_vals = split_data_vals[0]
                 corrected_def = split_data_vals[1]
                 # double check that we don't have a knum in the new definition
-                if re.match("K\d{5}",corrected_def):
+                if KEGG_KNUM_PATTERN.match(corrected_def):
                     corrected_vals = "".join([corrected_vals,corrected_def])
                     corrected_def = None
                 is_corrected = True
@@ -7480,7 +7494,7 @@ class ModulesDatabase(KeggContext):
                 is_corrected = True
         elif current_data_name == "REACTION":
             # example format: R01899+R00268,R00267,R00709
-            rnums = [x for x in re.split(',|\+', data_vals) if x]
+            rnums = [x for x in KEGG_REACTION_SPLIT_PATTERN.split(data_vals) if x]
             for r in rnums:
                 if r[0] != 'R' or len(r) != 6:
                     is_ok = False
@@ -7614,7 +7628,7 @@ class ModulesDatabase(KeggContext):
         data_types_to_split = ["ORTHOLOGY","REACTION"] # lines that fall under these categories need to have data_vals split on comma
         if current_data_name in data_types_to_split:
             # here we should NOT split on any commas within parentheses
-            vals = [x for x in re.split('\(|\)|,|\+|-', data_vals) if x]
+            vals = [x for x in KEGG_ORTHOLOGY_SPLIT_PATTERN.split(data_vals) if x]
             for val in vals:
                 line_entries.append((current_data_name, val, data_def, line_num))
         else:
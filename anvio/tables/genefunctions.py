@@ -175,5 +175,30 @@ class TableForGeneFunctions(Table):
                                         f"for {P('unique gene call', unique_num_genes)} have been added to the contigs database.")
 
 
+    def create_from_entries(self, db_entries, drop_previous_annotations_first=False):
+        """Store gene function calls provided as tuples ordered per the gene function calls table
+        structure, skipping the dict-of-dicts intermediate required by `create`."""
+        self.sanity_check()
+
+        # open connection
+        database = db.DB(self.db_path, utils.get_required_version_for_db(self.db_path))
+
+        # Add the new sources to existing sources
+        gene_function_sources = set([entry[1] for entry in db_entries])
+        self.add_new_sources_to_functional_sources(gene_function_sources, database, drop_previous_annotations_first=drop_previous_annotations_first)
+
+        unique_num_genes = len(set([entry[0] for entry in db_entries]))
+
+        # push the data
+        database._exec_many('''INSERT INTO %s VALUES (?,?,?,?,?)''' % t.gene_function_calls_table_name, db_entries)
+
+        # disconnect like a pro.
+        database.disconnect()
+
+        sources_string = ", ".join(gene_function_sources)
+        self.run.info('Gene functions', f"{P('function call', len(db_entries))} from {P('source', len(gene_function_sources))} ({sources_string}) "
+                                        f"for {P('unique gene call', unique_num_genes)} have been added to the contigs database.")
+
+
     def sanity_check(self):
         pass
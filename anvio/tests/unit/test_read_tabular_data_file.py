@@ -0,0 +1,73 @@
+# -*- coding: utf-8
+# pylint: disable=line-too-long
+"""
+    Unit tests for reading tab-delimited reference tables in the reaction network module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import anvio
+import anvio.biochemistry.reactionnetwork as reactionnetwork
+
+__author__ = "Developers of anvi'o (see AUTHORS.txt)"
+__copyright__ = "Copyleft 2015-2023, the Meren Lab (http://merenlab.org/)"
+__credits__ = []
+__license__ = "GPL 3.0"
+__version__ = anvio.__version__
+__maintainer__ = "Samuel Miller"
+__email__ = "samuelmiller10@gmail.com"
+
+
+# A miniature reactions table in the format of the ModelSEED Biochemistry reference: empty and
+# 'null' fields mark reactions without an equation or aliases and must load as missing values.
+TABLE = (
+    '\tname\tstoichiometry\tKEGG\n'
+    '0\trxn one\t-1:cpd1;1:cpd2\tR00001\n'
+    '1\trxn two\t\t\n'
+    '2\trxn three\tnull\tnull\n'
+)
+
+
+class ReadTabularDataFileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'reactions.tsv')
+        with open(self.path, 'w') as table_file:
+            table_file.write(TABLE)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check_empty_fields_are_missing(self, table):
+        for column in ('stoichiometry', 'KEGG'):
+            self.assertFalse(reactionnetwork.is_na(table.loc[0, column]))
+            self.assertTrue(reactionnetwork.is_na(table.loc[1, column]))
+            self.assertTrue(reactionnetwork.is_na(table.loc[2, column]))
+
+    def test_pandas_reader_loads_empty_fields_as_missing(self):
+        pyarrow_csv = reactionnetwork.pyarrow_csv
+        reactionnetwork.pyarrow_csv = None
+        try:
+            table = reactionnetwork.read_tabular_data_file(self.path)
+        finally:
+            reactionnetwork.pyarrow_csv = pyarrow_csv
+
+        self.check_empty_fields_are_missing(table)
+
+    @unittest.skipIf(reactionnetwork.pyarrow_csv is None, "pyarrow is not installed")
+    def test_pyarrow_reader_loads_empty_fields_as_missing(self):
+        self.check_empty_fields_are_missing(reactionnetwork.read_tabular_data_file(self.path))
+
+    @unittest.skipIf(reactionnetwork.pyarrow_csv is None, "pyarrow is not installed")
+    def test_parquet_cache_preserves_missing_fields(self):
+        # The first load writes the Parquet cache beside the file; the second is served from it.
+        reactionnetwork.read_tabular_data_file(self.path)
+        self.assertTrue(os.path.isfile(os.path.join(self.directory, 'reactions.parquet')))
+        self.check_empty_fields_are_missing(reactionnetwork.read_tabular_data_file(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()